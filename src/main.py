@@ -1,8 +1,26 @@
 import os
+import concurrent.futures
+import functools
+import sqlite3
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import dataclasses
 import datetime
 import logging
 import pytz
+
+try:
+    # orjson 是原生实现，解析 API 响应比标准库快数倍
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:
+    import json
+    _json_loads = json.loads
+    _json_dumps = json.dumps
 from telegram import Update, Bot
 from telegram.ext import Updater, CommandHandler, CallbackContext
 from apscheduler.schedulers.background import BackgroundScheduler
@@ -16,19 +34,131 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # --- 环境变量配置 ---
-# 全新的凭证变量，格式为 "VEID1:API_KEY1;VEID2:API_KEY2"
-BWH_VARS_STR = os.environ.get("BWH_VARS")
-BWH_CREDS = []
-if BWH_VARS_STR:
-    for pair in BWH_VARS_STR.split(';'):
+@dataclasses.dataclass(frozen=True)
+class Config:
+    """启动时解析一次的环境变量配置（不可变）"""
+    bwh_vars_str: str
+    bwh_creds: tuple
+    authorized_users: frozenset
+    cron_hours_cst: tuple
+
+
+def _load_config():
+    """从环境变量读取并解析全部配置"""
+    # 凭证变量格式为 "VEID1:API_KEY1;VEID2:API_KEY2"
+    bwh_vars_str = os.environ.get("BWH_VARS", "")
+    bwh_creds = []
+    for pair in bwh_vars_str.split(';'):
         if ':' in pair:
             veid, api_key = pair.split(':', 1)
-            BWH_CREDS.append({'veid': veid.strip(), 'api_key': api_key.strip()})
+            bwh_creds.append({'veid': veid.strip(), 'api_key': api_key.strip()})
+
+    return Config(
+        bwh_vars_str=bwh_vars_str,
+        bwh_creds=tuple(bwh_creds),
+        # frozenset 让每条消息的鉴权检查是 O(1) 查找
+        authorized_users=frozenset(
+            int(user_id.strip())
+            for user_id in os.environ.get("TELEGRAM_CHAT_ID", "").split(',')
+            if user_id.strip()
+        ),
+        # 定时任务的小时数 (CST)，默认北京时间早上8点
+        cron_hours_cst=tuple(
+            int(h.strip())
+            for h in os.environ.get("CRON_HOURS", "8").split(',')
+            if h.strip().isdigit()
+        ),
+    )
+
+
+CONFIG = _load_config()
+BWH_VARS_STR = CONFIG.bwh_vars_str
+BWH_CREDS = CONFIG.bwh_creds
+AUTHORIZED_USERS = CONFIG.authorized_users
+CRON_HOURS_CST = CONFIG.cron_hours_cst
 
-# 将 Chat ID 作为授权用户列表
-AUTHORIZED_USERS = [int(user_id.strip()) for user_id in os.environ.get("TELEGRAM_CHAT_ID", "").split(',') if user_id.strip()]
-# 定时任务的小时数 (CST)，默认北京时间早上8点
-CRON_HOURS_CST = [int(h.strip()) for h in os.environ.get("CRON_HOURS", "8").split(',') if h.strip().isdigit()]
+# 用于并发查询多台 VPS 的线程池（模块级，避免每次请求都重建线程）
+_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(BWH_CREDS) or 1))
+
+# 复用同一个 Session，使所有 API 请求共享连接池，省去重复的 TCP/TLS 握手；
+# 对瞬时的连接失败和上游 5xx 做有限次指数退避重试
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset(['GET']),
+)
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=_RETRY))
+
+# (连接, 读取) 超时，避免上游挂起时处理线程被永久阻塞
+_REQUEST_TIMEOUT = (3.05, 10)
+
+# 群发消息的最小间隔，保持在 Telegram 30 条/秒的机器人限速之下，
+# 避免触发 429 Retry-After 惩罚
+_BROADCAST_INTERVAL = 1.0 / 25
+
+# pytz 的时区查找内部带锁，UTC 常量在模块级取一次即可
+_UTC = pytz.utc
+
+# API 响应缓存：veid -> (时间戳, data)。流量数据分钟级变化即可，
+# 短 TTL 可避免 /traffic 刷屏或多用户定时任务对上游的重复请求。
+_CACHE = {}
+_CACHE_LOCK = threading.Lock()
+_CACHE_TTL = 90  # 秒
+
+# 在途请求表（single-flight）：veid -> Future。缓存未命中时只放行
+# 第一个调用者真正请求上游，并发的其余调用者等待同一个结果。
+_INFLIGHT = {}
+
+# 磁盘缓存：把 API 响应落到 sqlite，进程重启（容器重建）后仍可复用，
+# 上游故障时也能以最后一次成功的结果兜底
+_CACHE_DB_PATH = os.environ.get("BWH_CACHE_DB", "bwh_cache.db")
+_CACHE_DB_LOCK = threading.Lock()
+try:
+    _CACHE_DB = sqlite3.connect(_CACHE_DB_PATH, check_same_thread=False)
+    _CACHE_DB.execute(
+        "CREATE TABLE IF NOT EXISTS bwh_cache (veid TEXT PRIMARY KEY, ts REAL, data BLOB)"
+    )
+    _CACHE_DB.commit()
+except sqlite3.Error as e:
+    logger.warning(f"无法打开磁盘缓存 {_CACHE_DB_PATH}，将只使用内存缓存: {e}")
+    _CACHE_DB = None
+
+
+def _cache_db_get(veid):
+    """读取磁盘缓存，返回 (时间戳, data)，没有或损坏时返回 None"""
+    if _CACHE_DB is None:
+        return None
+    try:
+        with _CACHE_DB_LOCK:
+            row = _CACHE_DB.execute(
+                "SELECT ts, data FROM bwh_cache WHERE veid = ?", (veid,)
+            ).fetchone()
+    except sqlite3.Error as e:
+        logger.warning(f"读取磁盘缓存失败 (VEID: {veid}): {e}")
+        return None
+    if row is None:
+        return None
+    try:
+        return row[0], _json_loads(row[1])
+    except ValueError:
+        return None
+
+
+def _cache_db_put(veid, data):
+    """把成功的 API 响应写入磁盘缓存"""
+    if _CACHE_DB is None:
+        return
+    try:
+        with _CACHE_DB_LOCK:
+            _CACHE_DB.execute(
+                "INSERT OR REPLACE INTO bwh_cache (veid, ts, data) VALUES (?, ?, ?)",
+                (veid, time.time(), _json_dumps(data)),
+            )
+            _CACHE_DB.commit()
+    except sqlite3.Error as e:
+        logger.warning(f"写入磁盘缓存失败 (VEID: {veid}): {e}")
 
 
 def get_bwh_service_info(veid, api_key):
@@ -36,16 +166,65 @@ def get_bwh_service_info(veid, api_key):
     if not veid or not api_key:
         return None, "VEID 或 API Key 未提供。"
 
+    with _CACHE_LOCK:
+        hit = _CACHE.get(veid)
+        if hit and time.monotonic() - hit[0] < _CACHE_TTL:
+            return hit[1], None
+        inflight = _INFLIGHT.get(veid)
+        is_owner = inflight is None
+        if is_owner:
+            inflight = concurrent.futures.Future()
+            _INFLIGHT[veid] = inflight
+
+    if not is_owner:
+        # 同一 VEID 已有请求在途，等待它的结果即可
+        return inflight.result()
+
+    try:
+        result = _fetch_bwh_service_info(veid, api_key, hit)
+    except BaseException as exc:
+        with _CACHE_LOCK:
+            _INFLIGHT.pop(veid, None)
+        inflight.set_exception(exc)
+        raise
+
+    with _CACHE_LOCK:
+        _INFLIGHT.pop(veid, None)
+    inflight.set_result(result)
+    return result
+
+
+def _fetch_bwh_service_info(veid, api_key, stale_hit):
+    """真正请求上游 API 并维护缓存（由 single-flight 的持有者调用）"""
+    # 重启后内存缓存是空的，先看磁盘上有没有足够新鲜的数据
+    db_hit = _cache_db_get(veid)
+    if db_hit and time.time() - db_hit[0] < _CACHE_TTL:
+        with _CACHE_LOCK:
+            _CACHE[veid] = (time.monotonic(), db_hit[1])
+        return db_hit[1], None
+
     url = f"https://api.64clouds.com/v1/getServiceInfo?veid={veid}&api_key={api_key}"
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=_REQUEST_TIMEOUT)
         response.raise_for_status()
-        data = response.json()
+        data = _json_loads(response.content)
         if data.get("error") != 0:
             return None, data.get('message', 'API 返回未知错误')
+        with _CACHE_LOCK:
+            _CACHE[veid] = (time.monotonic(), data)
+        _cache_db_put(veid, data)
         return data, None
-    except requests.exceptions.RequestException as e:
+    # ValueError 覆盖 orjson/json 的 JSONDecodeError：上游经 Cloudflare
+    # 代理，偶尔会对 200 响应返回 HTML 插页
+    except (requests.exceptions.RequestException, ValueError) as e:
         logger.error(f"请求搬瓦工 API 时发生错误 (VEID: {veid}): {e}")
+        # 网络故障时退回最近一次成功的结果，而不是直接报错
+        if stale_hit:
+            logger.warning(f"网络错误，使用过期缓存数据 (VEID: {veid})")
+            return stale_hit[1], None
+        if db_hit:
+            logger.warning(f"网络错误，使用磁盘缓存数据 (VEID: {veid})")
+            return db_hit[1], None
         return None, f"请求搬瓦工 API 时发生网络错误"
 
 
@@ -56,6 +235,10 @@ def format_bytes(byte_count):
     return round(byte_count / (1024**3), 2)
 
 
+# 1/8 到 7/8 方块的字形表（模块级元组，避免每次调用重新分配列表）
+_PARTIAL_BLOCKS = ('▏', '▎', '▍', '▌', '▋', '▊', '▉')
+
+
 def create_progress_bar(percentage, width=12):
     """
     Creates a text-based progress bar.
@@ -66,108 +249,119 @@ def create_progress_bar(percentage, width=12):
     if percentage >= 100:
         return f"[{'█' * width}]"
 
-    progress_ratio = percentage / 100.0
-    filled_count = progress_ratio * width
-    
-    full_blocks = int(filled_count)
-    
-    # partial_blocks represents 1/8 to 7/8 of a block
-    partial_blocks = ['▏', '▎', '▍', '▌', '▋', '▊', '▉']
-    
-    partial_amount = filled_count - full_blocks
-    partial_index = int(partial_amount * 8)
-    
-    bar = '█' * full_blocks
-    
-    if full_blocks < width:
-        if partial_index > 0 and partial_index <= len(partial_blocks):
-            bar += partial_blocks[partial_index - 1]
-        elif full_blocks == 0 and percentage > 0:
-            # For very small percentages, show the smallest possible bar
-            bar += '▏'
+    # 以 1/8 个方块为单位走单一整数路径，省去逐分支的浮点运算
+    filled_eighths = int(percentage * width * 8 / 100)
+    full_blocks, partial_index = divmod(filled_eighths, 8)
+
+    if full_blocks == 0 and partial_index == 0:
+        # For very small percentages, show the smallest possible bar
+        partial_index = 1
 
-    empty_char = '·'
-    empty_count = width - len(bar)
-    bar += empty_char * empty_count
+    partial = _PARTIAL_BLOCKS[partial_index - 1] if partial_index else ''
+    empty_count = width - full_blocks - (1 if partial else 0)
 
-    return f"[{bar}]"
+    return f"[{'█' * full_blocks}{partial}{'·' * empty_count}]"
 
 
-def _get_cycle_start_date(end_date):
-    """根据周期结束日期估算周期开始日期（按月计）。"""
+@functools.lru_cache(maxsize=64)
+def _get_cycle_start_date(year, month, day):
+    """根据周期结束日期（年、月、日）估算周期开始日期（按月计）。
+
+    多台 VPS 通常共享同一个重置日，按原始值缓存可以避免在报告的
+    热循环里重复做日期运算。
+    """
     # 移动到结束日期所在月份的第一天
-    first_day_of_end_month = end_date.replace(day=1)
+    first_day_of_end_month = datetime.date(year, month, 1)
     # 再往前推一天，得到上个月的最后一天
     last_day_of_previous_month = first_day_of_end_month - datetime.timedelta(days=1)
-    
+
     try:
         # 尝试将日期设置为与结束日期相同的“日”
-        start_date = last_day_of_previous_month.replace(day=end_date.day)
+        start_date = last_day_of_previous_month.replace(day=day)
     except ValueError:
         # 如果“日”无效（例如，尝试从3月31日回到2月31日），
         # 则将开始日期定为上个月的最后一天（例如，2月28日或29日）。
         start_date = last_day_of_previous_month
-        
+
     return start_date
 
 
+def _format_vps_part(veid, info, error_message, now_utc):
+    """把单台 VPS 的查询结果格式化为报告片段（一次遍历完成全部计算）"""
+    if error_message:
+        return f"\n------\n*VPS (VEID: `{veid}`)*\n查询失败: `{error_message}`"
+
+    if not info:
+        return None
+
+    plan_monthly_data = info.get("plan_monthly_data")
+    data_counter = info.get("data_counter")
+    data_next_reset_ts = info.get("data_next_reset")
+    # 固定的 %Y-%m-%d 格式直接用 f-string 拼出来，绕开 strftime 的
+    # locale 机制和对格式串的逐次解析
+    reset_local = datetime.datetime.fromtimestamp(data_next_reset_ts)
+    data_next_reset_str = f'{reset_local.year:04d}-{reset_local.month:02d}-{reset_local.day:02d}'
+
+    # --- 计算时间进度 ---
+    time_percent = 0.0
+    if data_next_reset_ts:
+        reset_date_utc = datetime.datetime.fromtimestamp(data_next_reset_ts, tz=_UTC)
+        start_day = _get_cycle_start_date(
+            reset_date_utc.year, reset_date_utc.month, reset_date_utc.day
+        )
+        start_date_utc = reset_date_utc.replace(
+            year=start_day.year, month=start_day.month, day=start_day.day
+        )
+
+        cycle_duration = (reset_date_utc - start_date_utc).total_seconds()
+        elapsed_time = (now_utc - start_date_utc).total_seconds()
+
+        if cycle_duration > 0:
+            raw_time_percent = (elapsed_time / cycle_duration) * 100
+            # 将结果限制在 0-100 之间，并保留一位小数
+            time_percent = round(max(0, min(100, raw_time_percent)), 1)
+
+    used_gb = format_bytes(data_counter)
+    total_gb = format_bytes(plan_monthly_data)
+
+    usage_percent = 0
+    if plan_monthly_data and data_counter and plan_monthly_data > 0:
+        usage_percent = round((data_counter / plan_monthly_data) * 100, 2)
+
+    progress_bar = create_progress_bar(usage_percent)
+
+    return (
+        f"\n------\n"
+        f"🖥️ *主机:* `{info.get('hostname')}`\n"
+        f"📈 *流量:* `{used_gb} GB` / `{total_gb} GB`\n"
+        f"📊 *使用率:* {progress_bar} `{usage_percent}%` (⏳: `{time_percent}%`)\n"
+        f"📅 *重置日期:* `{data_next_reset_str}`"
+    )
+
+
 def _get_formatted_report():
     """获取并格式化所有 VPS 的流量报告 (核心逻辑)"""
     if not BWH_CREDS:
         return "错误: `BWH_VARS` 环境变量未设置或格式不正确。请确保格式为 'VEID1:API_KEY1;VEID2:API_KEY2'。"
 
-    report_parts = ["*VPS 流量总报告*"]
+    # 预先按最终大小分配片段列表，各结果按下标写入固定位置，
+    # 无需追加锁即可保持与 BWH_CREDS 一致的顺序
+    report_parts = ["*VPS 流量总报告*"] + [None] * len(BWH_CREDS)
 
-    for cred in BWH_CREDS:
-        veid = cred['veid']
-        api_key = cred['api_key']
-        info, error_message = get_bwh_service_info(veid, api_key)
-        
-        if error_message:
-            report_parts.append(f"\n------\n*VPS (VEID: `{veid}`)*\n查询失败: `{error_message}`")
-            continue
-        
-        if info:
-            plan_monthly_data = info.get("plan_monthly_data")
-            data_counter = info.get("data_counter")
-            data_next_reset_ts = info.get("data_next_reset")
-            data_next_reset_str = datetime.datetime.fromtimestamp(data_next_reset_ts).strftime('%Y-%m-%d')
-            
-            # --- 计算时间进度 ---
-            time_percent = 0.0
-            if data_next_reset_ts:
-                utc_tz = pytz.utc
-                reset_date_utc = datetime.datetime.fromtimestamp(data_next_reset_ts, tz=utc_tz)
-                start_date_utc = _get_cycle_start_date(reset_date_utc)
-                now_utc = datetime.datetime.now(utc_tz)
-                
-                cycle_duration = (reset_date_utc - start_date_utc).total_seconds()
-                elapsed_time = (now_utc - start_date_utc).total_seconds()
-
-                if cycle_duration > 0:
-                    raw_time_percent = (elapsed_time / cycle_duration) * 100
-                    # 将结果限制在 0-100 之间，并保留一位小数
-                    time_percent = round(max(0, min(100, raw_time_percent)), 1)
-
-            used_gb = format_bytes(data_counter)
-            total_gb = format_bytes(plan_monthly_data)
-            
-            usage_percent = 0
-            if plan_monthly_data and data_counter and plan_monthly_data > 0:
-                usage_percent = round((data_counter / plan_monthly_data) * 100, 2)
-            
-            progress_bar = create_progress_bar(usage_percent)
-
-            part = (
-                f"\n------\n"
-                f"🖥️ *主机:* `{info.get('hostname')}`\n"
-                f"📈 *流量:* `{used_gb} GB` / `{total_gb} GB`\n"
-                f"📊 *使用率:* {progress_bar} `{usage_percent}%` (⏳: `{time_percent}%`)\n"
-                f"📅 *重置日期:* `{data_next_reset_str}`"
-            )
-            report_parts.append(part)
-            
-    return "\n".join(report_parts)
+    # 并发发起所有 VPS 的 API 请求，再按原始顺序组装报告
+    futures = [
+        _EXECUTOR.submit(get_bwh_service_info, cred['veid'], cred['api_key'])
+        for cred in BWH_CREDS
+    ]
+
+    # 当前时间对整份报告取一次即可，无需每台 VPS 都查询系统时钟
+    now_utc = datetime.datetime.now(_UTC)
+
+    for index, (cred, future) in enumerate(zip(BWH_CREDS, futures)):
+        info, error_message = future.result()
+        report_parts[index + 1] = _format_vps_part(cred['veid'], info, error_message, now_utc)
+
+    return "\n".join(part for part in report_parts if part is not None)
 
 
 def start(update: Update, context: CallbackContext) -> None:
@@ -191,22 +385,27 @@ def get_traffic_info(update: Update, context: CallbackContext) -> None:
         update.message.reply_text("抱歉，您无权使用此机器人。")
         return
     sent_message = update.message.reply_text("正在查询所有 VPS 的流量信息，请稍候...")
-    message_id_to_delete = sent_message.message_id
-    chat_id = update.message.chat_id
     final_report = _get_formatted_report()
-    context.bot.delete_message(chat_id=chat_id, message_id=message_id_to_delete)
-    update.message.reply_text(final_report, parse_mode='Markdown')
+    # 直接把提示消息编辑为最终报告，比“删除再重发”少两次 API 往返
+    sent_message.edit_text(final_report, parse_mode='Markdown')
 
 
-def send_traffic_report(bot: Bot, chat_id: int):
-    """由调度器调用的函数，用于发送定时报告"""
-    logger.info(f"正在为 chat_id: {chat_id} 执行定时任务...")
+def broadcast_report(bot: Bot):
+    """由调度器调用的函数，生成一次报告后推送给所有授权用户"""
+    logger.info("正在执行定时任务，向所有授权用户推送流量报告...")
     try:
         final_report = _get_formatted_report()
-        bot.send_message(chat_id=chat_id, text=final_report, parse_mode='Markdown')
-        logger.info(f"已成功向 chat_id: {chat_id} 发送定时报告。")
     except Exception as e:
-        logger.error(f"向 chat_id: {chat_id} 发送定时报告失败: {e}")
+        logger.error(f"生成定时流量报告失败: {e}")
+        return
+    for index, chat_id in enumerate(AUTHORIZED_USERS):
+        if index:
+            time.sleep(_BROADCAST_INTERVAL)
+        try:
+            bot.send_message(chat_id=chat_id, text=final_report, parse_mode='Markdown')
+            logger.info(f"已成功向 chat_id: {chat_id} 发送定时报告。")
+        except Exception as e:
+            logger.error(f"向 chat_id: {chat_id} 发送定时报告失败: {e}")
 
 
 def send_startup_notification(bot: Bot, chat_id: int):
@@ -234,31 +433,67 @@ def main() -> None:
         logger.error("错误: 缺少必要的环境变量。请检查 BWH_VARS, TELEGRAM_BOT_TOKEN, 和 TELEGRAM_CHAT_ID。")
         exit(1)
 
-    updater = Updater(os.environ.get("TELEGRAM_BOT_TOKEN"), use_context=True)
+    # 可选：指向自建的本地 Bot API 服务器（如 http://127.0.0.1:8081），
+    # 与 VPS 同机房部署时可将每次 API 调用的往返延迟降到毫秒级
+    api_base = os.environ.get("TELEGRAM_API_BASE_URL")
+    updater = Updater(
+        os.environ.get("TELEGRAM_BOT_TOKEN"),
+        use_context=True,
+        workers=16,
+        base_url=f"{api_base.rstrip('/')}/bot" if api_base else None,
+        base_file_url=f"{api_base.rstrip('/')}/file/bot" if api_base else None,
+    )
     dispatcher = updater.dispatcher
     dispatcher.add_handler(CommandHandler("start", start))
-    dispatcher.add_handler(CommandHandler("traffic", get_traffic_info))
+    # /traffic 会阻塞在上游 API 的网络 I/O 上，放入工作线程池执行，
+    # 避免并发查询在调度器里排队
+    dispatcher.add_handler(CommandHandler("traffic", get_traffic_info, run_async=True))
     
     # --- 设置定时任务 ---
     if BWH_CREDS and AUTHORIZED_USERS and CRON_HOURS_CST:
         scheduler = BackgroundScheduler(timezone=pytz.timezone('Asia/Shanghai'))
-        for chat_id in AUTHORIZED_USERS:
-            for hour in CRON_HOURS_CST:
-                scheduler.add_job(
-                    send_traffic_report,
-                    'cron',
-                    hour=hour,
-                    kwargs={'bot': updater.bot, 'chat_id': chat_id}
-                )
-                logger.info(f"已为 chat_id: {chat_id} 添加了一个北京时间 {hour}:00 的定时任务。")
+        # 报告内容对所有用户相同，每个小时只需一个任务：
+        # 生成一次报告后广播，而不是每个用户各查一遍 API
+        for hour in CRON_HOURS_CST:
+            scheduler.add_job(
+                broadcast_report,
+                'cron',
+                hour=hour,
+                kwargs={'bot': updater.bot}
+            )
+            logger.info(f"已添加一个北京时间 {hour}:00 的定时广播任务。")
         scheduler.start()
     
-    updater.start_polling()
-    logger.info("机器人已启动，支持多 VPS (VEID:API_KEY) 查询。")
+    webhook_url = os.environ.get("WEBHOOK_URL")
+    if webhook_url:
+        # Webhook 模式：由 Telegram 主动推送更新，空闲时无任何出站请求
+        token = os.environ.get("TELEGRAM_BOT_TOKEN")
+        updater.start_webhook(
+            listen='0.0.0.0',
+            port=int(os.environ.get("PORT", "8443")),
+            url_path=token,
+            webhook_url=f"{webhook_url.rstrip('/')}/{token}",
+        )
+        logger.info("机器人已通过 Webhook 启动，支持多 VPS (VEID:API_KEY) 查询。")
+    else:
+        # 长轮询：让 getUpdates 在 Telegram 侧阻塞至多 30 秒，
+        # 空闲时几乎不产生请求，有消息时立即返回
+        updater.start_polling(
+            poll_interval=0.0,
+            timeout=30,
+            read_latency=2.0,
+            bootstrap_retries=-1,
+        )
+        logger.info("机器人已启动，支持多 VPS (VEID:API_KEY) 查询。")
+
+    # --- 在后台线程发送启动通知，机器人无需等通知发完即可响应命令 ---
+    def _notify_all():
+        for index, chat_id in enumerate(AUTHORIZED_USERS):
+            if index:
+                time.sleep(_BROADCAST_INTERVAL)
+            send_startup_notification(updater.bot, chat_id)
 
-    # --- 发送启动通知给所有授权用户 ---
-    for chat_id in AUTHORIZED_USERS:
-        send_startup_notification(updater.bot, chat_id)
+    threading.Thread(target=_notify_all, daemon=True, name='startup-notify').start()
 
     updater.idle()
 